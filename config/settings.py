@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -27,6 +28,10 @@ DEBUG = True
 
 ALLOWED_HOSTS = []
 
+# Serving-only deployments (rate-serving workers) skip the admin site, the API schema and docs, their apps
+# and the browsable API, which keeps app loading, worker boot time and per-worker memory minimal.
+SERVING_ONLY = os.environ.get('EXCHANGE_SERVING_ONLY') == '1'
+
 
 # Application definition
 
@@ -57,6 +62,15 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+if SERVING_ONLY:
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in (
+        'django.contrib.admin',
+        'django.contrib.messages',
+        'django.contrib.staticfiles',
+        'drf_spectacular',
+    )]
+    MIDDLEWARE.remove('django.contrib.messages.middleware.MessageMiddleware')
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -99,6 +113,16 @@ REST_FRAMEWORK = {
 
 }
 
+# Analytics results are cached for this many seconds and dropped as soon as rates are written.
+# With the default per-process local memory cache, a write only clears the cache of the worker
+# that handled it, configure a shared CACHES backend for multi-worker deployments.
+EXCHANGE_ANALYTICS_CACHE_TIMEOUT = 60 * 15
+
+if SERVING_ONLY:
+    TEMPLATES[0]['OPTIONS']['context_processors'].remove('django.contrib.messages.context_processors.messages')
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = ('rest_framework.renderers.JSONRenderer',)
+    del REST_FRAMEWORK['DEFAULT_SCHEMA_CLASS']
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
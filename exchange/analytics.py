@@ -0,0 +1,192 @@
+import hashlib
+from datetime import date
+from typing import List, Dict, Tuple, Optional, Any, Iterable
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from exchange.models import Exchange
+from exchange.utils import pair_to_column, column_to_pair, get_analytics_cache_version
+
+
+def load_rates(pairs: List[str], date_from: date, date_to: date) -> List[Tuple[date, str, str, Any]]:
+    """
+    Loads the exchange rates of the requested pairs for a date range in a single query.
+
+    Parameters:
+    pairs (List[str]): Currency pairs in the 'BASE/QUOTE' format.
+    date_from (date): The first date of the range, inclusive.
+    date_to (date): The last date of the range, inclusive.
+
+    Returns:
+    List[Tuple[date, str, str, Decimal]]: Rows of (date, base tag, quote tag, price) ordered by date.
+    """
+    pairs_filter = Q()
+    for pair in pairs:
+        base_currency, quote_currency = column_to_pair(pair)
+        pairs_filter |= Q(base_currency__tag=base_currency, quote_currency__tag=quote_currency)
+    exchanges = Exchange.objects.filter(pairs_filter, date__range=(date_from, date_to)).order_by('date')
+    return list(exchanges.values_list('date', 'base_currency__tag', 'quote_currency__tag', 'price'))
+
+
+def pivot_rates(rows: Iterable[Tuple[date, str, str, Any]], pairs: List[str]) -> Tuple[List[date], np.ndarray]:
+    """
+    Pivots melted exchange rate rows into a date x pair matrix, the reverse of melt_data.
+
+    Parameters:
+    rows (Iterable[Tuple[date, str, str, Decimal]]): Rows of (date, base tag, quote tag, price) ordered by date.
+    pairs (List[str]): Currency pairs in the 'BASE/QUOTE' format, defining the column order.
+
+    Returns:
+    Tuple[List[date], np.ndarray]: The sorted dates and a float64 array of shape (dates, pairs),
+                                   where missing and non-positive rates are NaN.
+    """
+    rows = list(rows)
+    dates = sorted({row[0] for row in rows})
+    date_index = {value: i for i, value in enumerate(dates)}
+    pair_index = {pair: i for i, pair in enumerate(pairs)}
+
+    prices = np.full((len(dates), len(pairs)), np.nan, dtype=np.float64)
+    if rows:
+        row_ids = np.fromiter((date_index[row[0]] for row in rows), dtype=np.intp, count=len(rows))
+        col_ids = np.fromiter((pair_index[pair_to_column(row[1], row[2])] for row in rows),
+                              dtype=np.intp, count=len(rows))
+        prices[row_ids, col_ids] = np.fromiter((row[3] for row in rows), dtype=np.float64, count=len(rows))
+    # A zero price would turn returns and drawdowns into infinities, so it is treated as missing.
+    prices[prices <= 0] = np.nan
+    return dates, prices
+
+
+def daily_returns(prices: np.ndarray) -> np.ndarray:
+    """
+    Calculates simple day-over-day returns for every column of the price matrix.
+
+    Parameters:
+    prices (np.ndarray): A float64 array of shape (dates, pairs).
+
+    Returns:
+    np.ndarray: A float64 array of the same shape as prices. The first row, and days
+                where either price is missing, are NaN.
+    """
+    returns = np.full(prices.shape, np.nan, dtype=np.float64)
+    returns[1:] = prices[1:] / prices[:-1] - 1
+    return returns
+
+
+def rolling_volatility(returns: np.ndarray, window: int) -> np.ndarray:
+    """
+    Calculates the rolling sample standard deviation of returns over a fixed window.
+
+    Parameters:
+    returns (np.ndarray): A float64 array of shape (days, pairs).
+    window (int): The number of returns in each window.
+
+    Returns:
+    np.ndarray: A float64 array of the same shape as returns. The first window - 1 rows,
+                and windows with fewer than two known returns, are NaN.
+    """
+    volatility = np.full(returns.shape, np.nan, dtype=np.float64)
+    if returns.shape[0] < window:
+        return volatility
+
+    # Window sums come from differences of cumulative sums, so memory stays O(days x pairs) for any window.
+    # Returns are centered per column first, which keeps the sum of squares from losing precision.
+    missing = np.isnan(returns)
+    filled = np.where(missing, 0.0, returns)
+    center = filled.sum(axis=0) / np.maximum(np.count_nonzero(~missing, axis=0), 1)
+    values = np.where(missing, 0.0, filled - center)
+    zeros = np.zeros((1, returns.shape[1]), dtype=np.float64)
+    sums = np.concatenate((zeros, values.cumsum(axis=0)))
+    squares = np.concatenate((zeros, (values * values).cumsum(axis=0)))
+    counts = np.concatenate((zeros, (~missing).cumsum(axis=0, dtype=np.float64)))
+
+    total = sums[window:] - sums[:-window]
+    total_squares = squares[window:] - squares[:-window]
+    known = counts[window:] - counts[:-window]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = (total_squares - total * total / known) / (known - 1)
+    variance = np.where(known > 1, np.maximum(variance, 0.0), np.nan)
+    volatility[window - 1:] = np.sqrt(variance)
+    return volatility
+
+
+def max_drawdown(prices: np.ndarray) -> np.ndarray:
+    """
+    Calculates the maximum drawdown of every column of the price matrix.
+
+    Parameters:
+    prices (np.ndarray): A float64 array of shape (dates, pairs).
+
+    Returns:
+    np.ndarray: A float64 array of shape (pairs,) with the largest peak-to-trough decline
+                as a non-positive fraction, NaN for columns without prices.
+    """
+    if prices.shape[0] == 0:
+        return np.full(prices.shape[1], np.nan, dtype=np.float64)
+    # fmax skips NaN, so the running peak carries over the days without a rate.
+    running_max = np.fmax.accumulate(prices, axis=0)
+    drawdowns = prices / running_max - 1
+    known = ~np.isnan(drawdowns)
+    worst = np.where(known, drawdowns, np.inf).min(axis=0)
+    return np.where(known.any(axis=0), worst, np.nan)
+
+
+def to_list(values: np.ndarray) -> List[Optional[float]]:
+    """
+    Converts a float array into a JSON friendly list, replacing NaN and infinities with None.
+
+    Parameters:
+    values (np.ndarray): A one-dimensional float64 array.
+
+    Returns:
+    List[Optional[float]]: The values as Python floats, None where the value is not finite.
+    """
+    return [value if finite else None for value, finite in zip(values.tolist(), np.isfinite(values).tolist())]
+
+
+def calculate_statistics(pairs: List[str], date_from: date, date_to: date, window: int) -> Dict[str, Any]:
+    """
+    Calculates daily returns, rolling volatility and maximum drawdown of currency pairs over a date range.
+    Results are cached per pair set, date range and window for EXCHANGE_ANALYTICS_CACHE_TIMEOUT seconds,
+    or until the rates are written.
+
+    Parameters:
+    pairs (List[str]): Currency pairs in the 'BASE/QUOTE' format.
+    date_from (date): The first date of the range, inclusive.
+    date_to (date): The last date of the range, inclusive.
+    window (int): The number of returns in the rolling volatility window.
+
+    Returns:
+    Dict[str, Any]: The dates of the range and the statistics of every pair.
+    """
+    pairs = sorted(set(pairs))
+    #  The pair set is hashed, so the key stays short and memcached-safe however many pairs are requested.
+    pairs_hash = hashlib.md5(','.join(pairs).encode()).hexdigest()
+    cache_key = f"exchange-analytics:{get_analytics_cache_version()}:{pairs_hash}:{date_from}:{date_to}:{window}"
+    statistics = cache.get(cache_key)
+    if statistics is not None:
+        return statistics
+
+    dates, prices = pivot_rates(load_rates(pairs, date_from, date_to), pairs)
+    returns = daily_returns(prices)
+    volatility = rolling_volatility(returns, window)
+    drawdowns = to_list(max_drawdown(prices))
+
+    statistics = {
+        'date_from': date_from,
+        'date_to': date_to,
+        'window': window,
+        'dates': dates,
+        'pairs': {
+            pair: {
+                'returns': to_list(returns[:, i]),
+                'volatility': to_list(volatility[:, i]),
+                'max_drawdown': drawdowns[i],
+            }
+            for i, pair in enumerate(pairs)
+        },
+    }
+    cache.set(cache_key, statistics, settings.EXCHANGE_ANALYTICS_CACHE_TIMEOUT)
+    return statistics
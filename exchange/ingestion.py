@@ -0,0 +1,49 @@
+import pandas as pd
+
+from exchange.models import Exchange
+from exchange.utils import get_or_create_currency, bump_analytics_cache_version
+
+
+def melt_data(df_raw: pd.DataFrame) -> pd.DataFrame:
+    """
+    Transforms a DataFrame of currency exchange rates into a melted format.
+
+    Parameters:
+    df_raw (pd.DataFrame): A DataFrame with currency exchange rates, where each column
+                           represents a currency pair and each row represents a date.
+
+    Returns:
+    pd.DataFrame: A transformed DataFrame where each row contains a single record of
+                  currency pair and its exchange rate for a date.
+    """
+    melted_df = df_raw.melt(id_vars=['Date'], var_name='currency_pair', value_name='price')
+    melted_df[['base_currency', 'quote_currency']] = melted_df['currency_pair'].str.split('/', expand=True)
+    final_df = melted_df[['Date', 'base_currency', 'quote_currency', 'price']]
+    return final_df
+
+
+def upload_csv(file_path: str) -> None:
+    """
+    Loads data from a CSV file and saves it to the database.
+
+    Parameters:
+    file_path (str): Path to the CSV file.
+    """
+    df = pd.read_csv(file_path)
+    data = melt_data(df)
+    exchange_instances = []
+
+    for record in data.to_dict(orient='records'):
+        base_currency = get_or_create_currency(record['base_currency'])
+        quote_currency = get_or_create_currency(record['quote_currency'])
+        exchange_instance = Exchange(
+            date=record['Date'],
+            base_currency=base_currency,
+            quote_currency=quote_currency,
+            price=record['price']
+        )
+        exchange_instances.append(exchange_instance)
+
+    Exchange.objects.bulk_create(exchange_instances)
+    #  bulk_create sends no post_save signals, so the cached analytics are invalidated here.
+    bump_analytics_cache_version()
@@ -0,0 +1,43 @@
+import json
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from exchange.analytics import calculate_statistics
+from exchange.serializers import ExchangeStatisticsQuerySerializer
+
+
+class Command(BaseCommand):
+    help = 'Calculates daily returns, rolling volatility and maximum drawdown of currency pairs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('pairs', type=str, help='Comma separated currency pairs, e.g. EUR/USD,USD/CHF')
+        parser.add_argument('date_from', type=str, help='First date of the range (YYYY-MM-DD)')
+        parser.add_argument('date_to', type=str, help='Last date of the range (YYYY-MM-DD)')
+        parser.add_argument('--window', type=int, default=20, help='Rolling volatility window in days')
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        """
+        The main method that is called when the management command is executed.
+
+        It validates the command arguments the same way the analytics endpoint does,
+        calculates the statistics and writes them to stdout as JSON.
+
+        Parameters:
+        args (Any): Variable length argument list.
+        kwargs (Any): Arbitrary keyword arguments, contains 'pairs', 'date_from', 'date_to' and 'window'.
+
+        Raises:
+        CommandError: If the arguments are not valid.
+        """
+        serializer = ExchangeStatisticsQuerySerializer(data={
+            'pairs': kwargs['pairs'],
+            'date_from': kwargs['date_from'],
+            'date_to': kwargs['date_to'],
+            'window': kwargs['window'],
+        })
+        if not serializer.is_valid():
+            raise CommandError(json.dumps(serializer.errors))
+        statistics = calculate_statistics(**serializer.validated_data)
+        self.stdout.write(json.dumps(statistics, cls=DjangoJSONEncoder, indent=2))
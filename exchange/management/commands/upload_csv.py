@@ -1,7 +1,7 @@
 from typing import Any
 
 from django.core.management.base import BaseCommand
-from exchange.utils import upload_csv
+from exchange.ingestion import upload_csv
 
 
 class Command(BaseCommand):
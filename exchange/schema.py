@@ -0,0 +1,12 @@
+from django.conf import settings
+
+if settings.SERVING_ONLY:
+    #  Serving-only workers generate no API schema, so the annotations are no-ops and drf_spectacular is never loaded.
+    def extend_schema(*args, **kwargs):
+        return lambda f: f
+
+    class OpenApiParameter:
+        def __init__(self, *args, **kwargs):
+            pass
+else:
+    from drf_spectacular.utils import extend_schema, OpenApiParameter  # noqa: F401
@@ -1,7 +1,11 @@
 from rest_framework import serializers
 
 from exchange.models import Exchange
-from exchange.utils import get_or_create_currency
+from exchange.utils import get_or_create_currency, column_to_pair
+
+ANALYTICS_MAX_PAIRS = 20
+ANALYTICS_MAX_DAYS = 5 * 366
+ANALYTICS_MAX_WINDOW = 260
 
 
 class ExchangeSerializer(serializers.ModelSerializer):
@@ -19,3 +23,29 @@ class ExchangeSerializer(serializers.ModelSerializer):
         internal_value['quote_currency'] = get_or_create_currency(tag=internal_value['quote_currency']['tag'])
         return internal_value
 
+
+class ExchangeStatisticsQuerySerializer(serializers.Serializer):
+    pairs = serializers.CharField()
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    window = serializers.IntegerField(min_value=2, max_value=ANALYTICS_MAX_WINDOW, default=20)
+
+    def validate_pairs(self, value):
+        pairs = [pair.strip() for pair in value.split(',') if pair.strip()]
+        if not pairs:
+            raise serializers.ValidationError('At least one currency pair is required.')
+        if len(set(pairs)) > ANALYTICS_MAX_PAIRS:
+            raise serializers.ValidationError(f'At most {ANALYTICS_MAX_PAIRS} currency pairs are allowed.')
+        for pair in pairs:
+            try:
+                column_to_pair(pair)
+            except ValueError as e:
+                raise serializers.ValidationError(str(e))
+        return pairs
+
+    def validate(self, attrs):
+        if attrs['date_from'] > attrs['date_to']:
+            raise serializers.ValidationError({'date_to': 'date_to must not be earlier than date_from.'})
+        if (attrs['date_to'] - attrs['date_from']).days >= ANALYTICS_MAX_DAYS:
+            raise serializers.ValidationError({'date_to': f'The date range must not exceed {ANALYTICS_MAX_DAYS} days.'})
+        return attrs
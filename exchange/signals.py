@@ -0,0 +1,14 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from exchange.models import Exchange
+from exchange.utils import bump_analytics_cache_version
+
+
+@receiver(post_save, sender=Exchange)
+@receiver(post_delete, sender=Exchange)
+def invalidate_analytics_cache(sender, **kwargs) -> None:
+    """
+    Invalidates the cached analytics whenever an exchange rate is created, updated or deleted.
+    """
+    bump_analytics_cache_version()
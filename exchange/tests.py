@@ -1,3 +1,254 @@
-from django.test import TestCase
+import json
+import math
+import os
+import re
+import subprocess
+import sys
+from datetime import date
+from io import StringIO
+from typing import Dict
+from unittest import skipIf, skipUnless
 
-# Create your tests here.
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from exchange.analytics import pivot_rates, daily_returns, rolling_volatility, max_drawdown, calculate_statistics
+from exchange.models import Currency, Exchange
+
+# Modules that only ingestion, analytics and the API docs need, the serving path must never import them.
+HEAVY_MODULES = {'pandas', 'numpy', 'drf_spectacular'}
+# Timing and memory depend on the machine, so slow runners can raise the budgets from the environment.
+# The defaults sit just above the serving-only baseline: about 710 modules, 0.35-0.5 s and 48 MB. Importing NumPy
+# (about 820 modules, 64 MB) or pandas (about 1150 modules, 0.55 s or more, 95 MB) breaks them. The module count
+# is the deterministic one, the time check takes the fastest of several runs to keep it apart from noise.
+IMPORTED_MODULES_BUDGET = int(os.environ.get('EXCHANGE_IMPORTED_MODULES_BUDGET', 760))
+IMPORT_TIME_BUDGET_US = int(os.environ.get('EXCHANGE_IMPORT_TIME_BUDGET_US', 530_000))
+MAX_RSS_BUDGET_KB = int(os.environ.get('EXCHANGE_MAX_RSS_BUDGET_KB', 56 * 1024))
+MEASURED_RUNS = 5
+
+# Boots the WSGI application and resolves every URL pattern, like the first request to a worker does.
+SERVING_PATH_SCRIPT = """
+import sys
+from config.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+if sys.platform == 'linux':
+    # ru_maxrss survives exec on Linux and would report the test runner's peak, VmHWM starts fresh.
+    with open('/proc/self/status') as status:
+        print(next(line.split()[1] for line in status if line.startswith('VmHWM:')))
+elif sys.platform != 'win32':
+    import resource
+    print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+# Boots the WSGI application and prints which of the URLs are routed.
+ROUTES_SCRIPT = """
+from config.wsgi import application
+from django.urls import resolve, Resolver404
+for url in ('/exchange/rate/', '/admin/', '/api/docs/'):
+    try:
+        resolve(url)
+        print(url)
+    except Resolver404:
+        pass
+"""
+
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S+)$')
+
+
+def run_script(script: str, *options: str, serving_only: bool = True) -> subprocess.CompletedProcess:
+    """
+    Runs a script in a fresh interpreter with the project settings, as a new worker would start.
+
+    Parameters:
+    script (str): The Python source to run.
+    options (str): Extra interpreter options, e.g. '-X', 'importtime'.
+    serving_only (bool): Whether to run with EXCHANGE_SERVING_ONLY enabled.
+
+    Returns:
+    subprocess.CompletedProcess: The finished process with its stdout and stderr as text.
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE='config.settings')
+    env.pop('EXCHANGE_SERVING_ONLY', None)
+    if serving_only:
+        env['EXCHANGE_SERVING_ONLY'] = '1'
+    return subprocess.run(
+        [sys.executable, *options, '-c', script],
+        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+    )
+
+
+def parse_import_times(stderr: str) -> Dict[str, int]:
+    """
+    Parses the output of python -X importtime.
+
+    Parameters:
+    stderr (str): The stderr of a process run with -X importtime.
+
+    Returns:
+    Dict[str, int]: The self import time in microseconds of every imported module.
+    """
+    imports = {}
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, module = match.groups()
+            imports[module] = int(self_us)
+    return imports
+
+
+class ServingPathImportsTest(SimpleTestCase):
+    def test_heavy_modules_are_not_imported(self):
+        result = run_script(SERVING_PATH_SCRIPT, '-X', 'importtime')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        imported = {module.split('.')[0] for module in parse_import_times(result.stderr)}
+        self.assertFalse(imported & HEAVY_MODULES, 'The serving path imports heavy modules.')
+
+
+class ServingPathBudgetTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The first run compiles the bytecode cache on a cold checkout, only the runs after it are measured.
+        run_script(SERVING_PATH_SCRIPT)
+        cls.results = [run_script(SERVING_PATH_SCRIPT, '-X', 'importtime') for _ in range(MEASURED_RUNS)]
+
+    def setUp(self):
+        for result in self.results:
+            self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_imported_modules_budget(self):
+        self.assertLessEqual(len(parse_import_times(self.results[0].stderr)), IMPORTED_MODULES_BUDGET)
+
+    def test_import_time_budget(self):
+        total_us = min(sum(parse_import_times(result.stderr).values()) for result in self.results)
+        self.assertLessEqual(total_us, IMPORT_TIME_BUDGET_US)
+
+    @skipUnless(sys.platform != 'win32', 'The resource module is not available on Windows.')
+    def test_max_rss_budget(self):
+        max_rss_kb = min(int(result.stdout.split()[-1]) for result in self.results)
+        if sys.platform == 'darwin':  # ru_maxrss is reported in bytes on macOS.
+            max_rss_kb //= 1024
+        self.assertLessEqual(max_rss_kb, MAX_RSS_BUDGET_KB)
+
+
+class DeploymentRoutesTest(SimpleTestCase):
+    def test_serving_only_routes(self):
+        result = run_script(ROUTES_SCRIPT)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split(), ['/exchange/rate/'])
+
+    def test_full_deployment_routes(self):
+        result = run_script(ROUTES_SCRIPT, serving_only=False)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split(), ['/exchange/rate/', '/admin/', '/api/docs/'])
+
+    @skipIf(settings.SERVING_ONLY, 'The admin site is not installed in serving-only mode.')
+    def test_admin_is_served(self):
+        response = self.client.get('/admin/')
+        self.assertRedirects(response, '/admin/login/?next=/admin/', fetch_redirect_response=False)
+
+
+class AnalyticsComputationTest(SimpleTestCase):
+    def test_pivot_rates_with_pair_missing_on_some_dates(self):
+        rows = [
+            (date(2020, 1, 2), 'EUR', 'USD', 1.1),
+            (date(2020, 1, 2), 'USD', 'CHF', 0.97),
+            (date(2020, 1, 3), 'EUR', 'USD', 1.2),
+            (date(2020, 1, 6), 'USD', 'CHF', 0.98),
+        ]
+        dates, prices = pivot_rates(rows, ['EUR/USD', 'USD/CHF'])
+        self.assertEqual(dates, [date(2020, 1, 2), date(2020, 1, 3), date(2020, 1, 6)])
+        np.testing.assert_array_equal(prices, [[1.1, 0.97], [1.2, np.nan], [np.nan, 0.98]])
+
+    def test_pivot_rates_treats_non_positive_prices_as_missing(self):
+        dates, prices = pivot_rates([(date(2020, 1, 2), 'EUR', 'USD', 0)], ['EUR/USD'])
+        np.testing.assert_array_equal(prices, [[np.nan]])
+
+    def test_daily_returns_and_rolling_volatility(self):
+        prices = np.array([[1.0], [1.1], [0.99], [1.089]])
+        returns = daily_returns(prices)
+        np.testing.assert_allclose(returns[:, 0], [np.nan, 0.1, -0.1, 0.1])
+
+        volatility = rolling_volatility(returns, 3)
+        # The first full window holds NaN, 0.1 and -0.1, so only two returns are known.
+        np.testing.assert_allclose(volatility[:, 0], [np.nan, np.nan, math.sqrt(0.02), math.sqrt(0.04 / 3)])
+
+    def test_rolling_volatility_needs_two_known_returns(self):
+        returns = np.array([[np.nan], [0.1], [np.nan], [np.nan]])
+        np.testing.assert_array_equal(rolling_volatility(returns, 2)[:, 0], [np.nan] * 4)
+        np.testing.assert_array_equal(rolling_volatility(returns, 5)[:, 0], [np.nan] * 4)
+
+    def test_max_drawdown_with_leading_nans(self):
+        prices = np.array([[np.nan, np.nan], [np.nan, np.nan], [2.0, np.nan],
+                           [3.0, np.nan], [1.5, np.nan], [2.0, np.nan]])
+        np.testing.assert_array_equal(max_drawdown(prices), [-0.5, np.nan])
+
+
+class ExchangeStatisticsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        eur, usd, chf = (Currency.objects.create(tag=tag) for tag in ('EUR', 'USD', 'CHF'))
+        for day, price in ((2, '1.0'), (3, '1.1'), (6, '0.99'), (7, '1.089')):
+            Exchange.objects.create(date=date(2020, 1, day), base_currency=eur, quote_currency=usd, price=price)
+        Exchange.objects.create(date=date(2020, 1, 3), base_currency=usd, quote_currency=chf, price='0.97')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_statistics(self):
+        response = self.client.get(reverse('exchange-analytics'), {
+            'pairs': 'EUR/USD,USD/CHF', 'date_from': '2020-01-01', 'date_to': '2020-01-31', 'window': 3,
+        })
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['dates'], ['2020-01-02', '2020-01-03', '2020-01-06', '2020-01-07'])
+        self.assertEqual(data['pairs']['EUR/USD']['returns'][0], None)
+        self.assertAlmostEqual(data['pairs']['EUR/USD']['volatility'][3], math.sqrt(0.04 / 3))
+        self.assertAlmostEqual(data['pairs']['EUR/USD']['max_drawdown'], -0.1)
+        self.assertEqual(data['pairs']['USD/CHF']['returns'], [None] * 4)
+
+    def test_malformed_pair(self):
+        response = self.client.get(reverse('exchange-analytics'), {
+            'pairs': 'EURUSD', 'date_from': '2020-01-01', 'date_to': '2020-01-31',
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('pairs', response.json())
+
+    def test_malformed_or_over_long_tag(self):
+        for pairs in ('EUR /USD', 'eur/usd', 'E' * 300 + '/USD', 'EUR/US'):
+            with self.subTest(pairs=pairs):
+                response = self.client.get(reverse('exchange-analytics'), {
+                    'pairs': pairs, 'date_from': '2020-01-01', 'date_to': '2020-01-31',
+                })
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('pairs', response.json())
+
+    def test_date_from_after_date_to(self):
+        response = self.client.get(reverse('exchange-analytics'), {
+            'pairs': 'EUR/USD', 'date_from': '2020-02-01', 'date_to': '2020-01-01',
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('date_to', response.json())
+
+    def test_cache_hit_runs_no_query(self):
+        calculate_statistics(['EUR/USD'], date(2020, 1, 1), date(2020, 1, 31), 3)
+        with self.assertNumQueries(0):
+            calculate_statistics(['EUR/USD'], date(2020, 1, 1), date(2020, 1, 31), 3)
+
+    def test_cache_is_invalidated_when_rates_are_written(self):
+        statistics = calculate_statistics(['EUR/USD'], date(2020, 1, 1), date(2020, 1, 31), 3)
+        Exchange.objects.filter(date=date(2020, 1, 7)).get().delete()
+        updated = calculate_statistics(['EUR/USD'], date(2020, 1, 1), date(2020, 1, 31), 3)
+        self.assertEqual(len(statistics['dates']), 4)
+        self.assertEqual(len(updated['dates']), 3)
+
+    def test_exchange_stats_command(self):
+        out = StringIO()
+        call_command('exchange_stats', 'EUR/USD', '2020-01-01', '2020-01-31', '--window', '3', stdout=out)
+        data = json.loads(out.getvalue())
+        self.assertEqual(len(data['pairs']['EUR/USD']['returns']), 4)
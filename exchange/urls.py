@@ -1,9 +1,10 @@
 from django.urls import path
 
-from exchange.views import ExchangeViewSet, ExchangeRate, ExchangeHistoryViewSet
+from exchange.views import ExchangeViewSet, ExchangeRate, ExchangeHistoryViewSet, ExchangeStatistics
 
 urlpatterns = [
     path('rate/', ExchangeRate.as_view(), name='rate'),
+    path('analytics/', ExchangeStatistics.as_view(), name='exchange-analytics'),
     path('history/', ExchangeHistoryViewSet.as_view({'get': 'list'}), name='exchange-history'),
     path('', ExchangeViewSet.as_view({'post': 'create', 'get': 'list'}), name='exchange-list'),
     path('<str:date>/<str:base_currency>/<str:quote_currency>/', ExchangeViewSet.as_view(
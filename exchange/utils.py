@@ -1,8 +1,9 @@
+import re
 from collections import defaultdict
 from decimal import Decimal
 from typing import List, Dict, Tuple, Optional, Any
 
-import pandas as pd
+from django.core.cache import cache
 from django.http import Http404
 from rest_framework import status
 from rest_framework.generics import get_object_or_404
@@ -11,62 +12,76 @@ from rest_framework.views import exception_handler
 
 from exchange.models import Currency, Exchange
 
+ANALYTICS_CACHE_VERSION_KEY = 'exchange-analytics:version'
+CURRENCY_PAIR = re.compile(r'([A-Z]{3})/([A-Z]{3})')
 
-def melt_data(df_raw: pd.DataFrame) -> pd.DataFrame:
+
+def get_or_create_currency(tag: str) -> Currency:
     """
-    Transforms a DataFrame of currency exchange rates into a melted format.
+    Retrieves a Currency object by its tag, or creates a new one if it does not exist.
 
     Parameters:
-    df_raw (pd.DataFrame): A DataFrame with currency exchange rates, where each column
-                           represents a currency pair and each row represents a date.
+    tag (str): The tag of the currency (e.g., 'USD').
 
     Returns:
-    pd.DataFrame: A transformed DataFrame where each row contains a single record of
-                  currency pair and its exchange rate for a date.
+    Currency: The retrieved or newly created Currency object.
     """
-    melted_df = df_raw.melt(id_vars=['Date'], var_name='currency_pair', value_name='price')
-    melted_df[['base_currency', 'quote_currency']] = melted_df['currency_pair'].str.split('/', expand=True)
-    final_df = melted_df[['Date', 'base_currency', 'quote_currency', 'price']]
-    return final_df
+    currency, created = Currency.objects.get_or_create(tag=tag)
+    return currency
 
 
-def get_or_create_currency(tag: str) -> Currency:
+def pair_to_column(base_currency: str, quote_currency: str) -> str:
     """
-    Retrieves a Currency object by its tag, or creates a new one if it does not exist.
+    Joins a currency pair into a column name, the reverse of the split done in melt_data.
 
     Parameters:
-    tag (str): The tag of the currency (e.g., 'USD').
+    base_currency (str): The tag of the base currency (e.g., 'EUR').
+    quote_currency (str): The tag of the quote currency (e.g., 'USD').
 
     Returns:
-    Currency: The retrieved or newly created Currency object.
+    str: The column name of the pair (e.g., 'EUR/USD').
     """
-    currency, created = Currency.objects.get_or_create(tag=tag)
-    return currency
+    return f'{base_currency}/{quote_currency}'
 
 
-def upload_csv(file_path: str) -> None:
+def column_to_pair(column: str) -> Tuple[str, str]:
     """
-    Loads data from a CSV file and saves it to the database.
+    Splits a column name into a currency pair, the same way melt_data does.
 
     Parameters:
-    file_path (str): Path to the CSV file.
+    column (str): The column name of the pair (e.g., 'EUR/USD').
+
+    Returns:
+    Tuple[str, str]: The base and quote currency tags.
+
+    Raises:
+    ValueError: If the column is not in the 'BASE/QUOTE' format with three letter uppercase tags.
     """
-    df = pd.read_csv(file_path)
-    data = melt_data(df)
-    exchange_instances = []
-
-    for record in data.to_dict(orient='records'):
-        base_currency = get_or_create_currency(record['base_currency'])
-        quote_currency = get_or_create_currency(record['quote_currency'])
-        exchange_instance = Exchange(
-            date=record['Date'],
-            base_currency=base_currency,
-            quote_currency=quote_currency,
-            price=record['price']
-        )
-        exchange_instances.append(exchange_instance)
+    match = CURRENCY_PAIR.fullmatch(column)
+    if match is None:
+        raise ValueError(f"Invalid currency pair '{column[:20]}', expected format 'BASE/QUOTE', e.g. 'EUR/USD'.")
+    return match.group(1), match.group(2)
+
+
+def get_analytics_cache_version() -> int:
+    """
+    Returns the current version of the cached analytics, which is part of every analytics cache key.
 
-    Exchange.objects.bulk_create(exchange_instances)
+    Returns:
+    int: The current version, 0 if no rates have been written yet.
+    """
+    return cache.get(ANALYTICS_CACHE_VERSION_KEY, 0)
+
+
+def bump_analytics_cache_version() -> None:
+    """
+    Invalidates all cached analytics by moving to a new version, so statistics
+    are never served from rates that have since been written.
+    """
+    try:
+        cache.incr(ANALYTICS_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(ANALYTICS_CACHE_VERSION_KEY, 1, None)
 
 
 def calculate_rate(base_currency_tag: str, quote_currency_tag: str, date: str) -> Optional[Decimal]:
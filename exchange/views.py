@@ -1,5 +1,4 @@
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema, OpenApiParameter
 from rest_framework import mixins
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
@@ -8,7 +7,8 @@ from rest_framework.viewsets import ModelViewSet, GenericViewSet
 
 from exchange.filters import ExchangeFilter
 from exchange.models import Exchange
-from exchange.serializers import ExchangeSerializer
+from exchange.schema import extend_schema, OpenApiParameter
+from exchange.serializers import ExchangeSerializer, ExchangeStatisticsQuerySerializer
 from exchange.utils import calculate_rate
 
 
@@ -56,3 +56,25 @@ class ExchangeRate(APIView):
             'quote_currency': quote_currency_tag,
             'price': rate
         })
+
+
+class ExchangeStatistics(APIView):
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name='pairs', description='Comma separated currency pairs, e.g. EUR/USD,USD/CHF',
+                             required=True, type=str),
+            OpenApiParameter(name='date_from', description='First date of the range', required=True, type=str),
+            OpenApiParameter(name='date_to', description='Last date of the range', required=True, type=str),
+            OpenApiParameter(name='window', description='Rolling volatility window in days, 20 by default',
+                             required=False, type=int),
+        ],
+        description="Retrieves daily returns, rolling volatility and maximum drawdown "
+                    "for the given currency pairs over a date range."
+    )
+    def get(self, request):
+        serializer = ExchangeStatisticsQuerySerializer(data=request.GET)
+        serializer.is_valid(raise_exception=True)
+        #  NumPy is imported here, not at module level, so that workers serving rates never load it.
+        from exchange.analytics import calculate_statistics
+        statistics = calculate_statistics(**serializer.validated_data)
+        return Response(statistics)